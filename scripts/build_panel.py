@@ -0,0 +1,20 @@
+import argparse
+from pathlib import Path
+from src.data_processor import build_panel
+from src.utils import get_path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Consolidate per-currency CSVs into the panel store."
+    )
+    parser.add_argument("source_dir", nargs="?", default=str(get_path("")))
+    parser.add_argument("--pattern", default="*.csv")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    build_panel(Path(args.source_dir), pattern=args.pattern, max_workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
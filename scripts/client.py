@@ -0,0 +1,39 @@
+import argparse
+import json
+from src.client import send_request
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send a request to the server.")
+    parser.add_argument("--socket", default=None, help="Unix socket path")
+    parser.add_argument("--port", type=int, default=None, help="Localhost port")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    fit = sub.add_parser("fit", help="Fit spec X on dataset Y")
+    fit.add_argument("spec")
+    fit.add_argument("dataset")
+
+    desc = sub.add_parser("descriptives", help="Descriptive statistics")
+    desc.add_argument("datasets", nargs="*", default=None)
+    desc.add_argument("--refresh", action="store_true")
+
+    table = sub.add_parser("table", help="Render a results table")
+    table.add_argument("dataset")
+    table.add_argument("specs", nargs="+")
+    table.add_argument("--filename", default=None)
+    table.add_argument("--caption", default=None)
+
+    sub.add_parser("status")
+    sub.add_parser("shutdown")
+
+    args = vars(parser.parse_args())
+    socket_path, port = args.pop("socket"), args.pop("port")
+    # Unset options and empty nargs="*" lists fall back to server defaults
+    request = {k: v for k, v in args.items() if v is not None and v != []}
+
+    result = send_request(request, path=socket_path, port=port)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import pandas as pd
 from arch import arch_model
 from src.data_processor import get_dataset
 from src.utils import save_output
+from src.models import fit_ar_garch, save_fit_series
 from src._latex_tables import DESIRED_ORDER, PARAM_MAP, format_coef_std
 
 
@@ -9,9 +10,7 @@ def estimate_replication_models(data):
     results = {}
 
     # GARCH(1,1): Symmetric by definition
-    results["GARCH model"] = arch_model(
-        data, mean="AR", lags=1, vol="GARCH", p=1, o=0, q=1
-    ).fit(disp="off", cov_type="robust")
+    results["GARCH model"] = fit_ar_garch(data, o=0, cov_type="robust")
 
     # APARCH(1,1): Set o=1 to force estimation of Gamma
     results["APARCH model"] = arch_model(
@@ -43,6 +42,8 @@ def main():
 
     df_results.index = [PARAM_MAP.get(idx, idx) for idx in df_results.index]
 
+    save_fit_series(model_fits, "Dataset I", series.index)
+
     save_output(
         df_results,
         "replication_results_d1.tex",
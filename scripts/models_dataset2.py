@@ -4,6 +4,7 @@ import pandas as pd
 from arch import arch_model
 from src.data_processor import get_dataset
 from src.utils import save_output
+from src.models import fit_ar_garch, save_fit_series
 from src._latex_tables import PARAM_MAP, DESIRED_ORDER, format_coef_std
 
 
@@ -18,9 +19,7 @@ def estimate_replication_models(data):
     ).fit(disp="off", cov_type="robust")
 
     # AGARCH(1,1): Asymmetric, implemented via GJR-GARCH
-    results["AGARCH"] = arch_model(
-        data, mean="AR", lags=1, vol="GARCH", p=1, o=1, q=1, power=2.0
-    ).fit(disp="off", cov_type="robust")
+    results["AGARCH"] = fit_ar_garch(data, o=1, cov_type="robust")
 
     return results
 
@@ -44,6 +43,8 @@ def main():
 
     df_results.index = [PARAM_MAP.get(idx, idx) for idx in df_results.index]
 
+    save_fit_series(model_fits, "Dataset II", series.index)
+
     save_output(
         df_results,
         "replication_results_d2.tex",
@@ -1,42 +1,35 @@
+import argparse
 import pandas as pd
 from src._latex_tables import DESIRED_ORDER, PARAM_MAP, format_coef_std
 from src.data_processor import get_dataset
 from arch import arch_model
-from src.utils import save_output
+from src.utils import load_config, save_output
+from src.models import (
+    EXTENDED_SPECS,
+    FilterState,
+    fit_two_stage,
+    save_filter_state,
+    save_fit_series,
+)
 
 
 def estimate_models(data):
-    results = {}
-    # GARCH(1,1) - three distributions
-    results["GARCH-N"] = arch_model(
-        data, mean="AR", lags=1, vol="GARCH", p=1, o=0, q=1, dist="normal"
-    )
-    results["GARCH-t"] = arch_model(
-        data, mean="AR", lags=1, vol="GARCH", p=1, o=0, q=1, dist="t"
-    )
-    results["GARCH-G"] = arch_model(
-        data, mean="AR", lags=1, vol="GARCH", p=1, o=0, q=1, dist="ged"
-    )
-    # FIGARCH(1,d,1) - three distributions
-    results["FIGARCH-N"] = arch_model(
-        data, mean="AR", lags=1, vol="FIGARCH", p=1, q=1, dist="normal"
-    )
-    results["FIGARCH-t"] = arch_model(
-        data, mean="AR", lags=1, vol="FIGARCH", p=1, q=1, dist="t"
-    )
-    results["FIGARCH-G"] = arch_model(
-        data, mean="AR", lags=1, vol="FIGARCH", p=1, q=1, dist="ged"
-    )
-    return results
+    return {name: arch_model(data, **spec) for name, spec in EXTENDED_SPECS.items()}
 
 
-def main():
+def main(two_stage: bool = False):
     series = get_dataset("Extended", transform="log")
     data = series.to_numpy()
-    print("Estimating extended models...")
-    model_fits = {
-        name: model.fit(disp="off") for name, model in estimate_models(data).items()
-    }
+
+    if two_stage:
+        # Screening mode: AR(1) by OLS once, variance models on its residuals
+        print("Estimating extended models (two-stage)...")
+        model_fits = fit_two_stage(data, EXTENDED_SPECS)
+    else:
+        print("Estimating extended models...")
+        model_fits = {
+            name: model.fit(disp="off") for name, model in estimate_models(data).items()
+        }
     table_data = {
         model_name: format_coef_std(fit) for model_name, fit in model_fits.items()
     }
@@ -49,19 +42,47 @@ def main():
     df_results.loc["AIC"] = {name: f"{fit.aic:.2f}" for name, fit in model_fits.items()}
     df_results.loc["BIC"] = {name: f"{fit.bic:.2f}" for name, fit in model_fits.items()}
 
+    suffix = "_two_stage" if two_stage else ""
+    save_fit_series(model_fits, f"Extended{suffix}", series.index)
+
+    if not two_stage:
+        # Filter states let scripts/update_filters.py roll forecasts forward
+        refit_every = load_config()["settings"].get("refit_every", 20)
+        for name, fit in model_fits.items():
+            state = FilterState.from_fit(
+                fit, EXTENDED_SPECS[name], series.index, refit_every=refit_every
+            )
+            save_filter_state(state, name, "Extended")
+
+    if two_stage:
+        estimation_note = [
+            "Standard errors in parentheses are robust and corrected for the first-stage OLS estimation of the AR(1) mean.",
+            "Variance models estimated via QMLE on the OLS residuals with a zero mean.",
+        ]
+    else:
+        estimation_note = [
+            "Standard errors in parentheses are \\textcite{bollerslev_woolridge1996} robust standard errors.",
+            "All models estimated via QMLE alongside an AR(1) mean equation.",
+        ]
+
     save_output(
         df_results,
-        "estimation_results_extended.tex",
+        f"estimation_results_extended{suffix}.tex",
         "tables",
         "models",
         caption="Estimation Results for Extended Dataset (2003--2023)",
-        note=[
-            "Standard errors in parentheses are \\textcite{bollerslev_woolridge1996} robust standard errors.",
-            "All models estimated via QMLE alongside an AR(1) mean equation.",
+        note=estimation_note
+        + [
             "Column suffixes denote the error distribution: -N (Gaussian), -t (Student's $t$), -G (GED).",
         ],
     )
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--two-stage",
+        action="store_true",
+        help="Fast screening: OLS mean once, then zero-mean variance models",
+    )
+    main(two_stage=parser.parse_args().two_stage)
@@ -0,0 +1,18 @@
+import argparse
+import asyncio
+from src.server import EstimationServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the estimation server.")
+    parser.add_argument("--socket", default=None, help="Unix socket path")
+    parser.add_argument("--port", type=int, default=None, help="Localhost port")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    server = EstimationServer(max_workers=args.workers)
+    asyncio.run(server.serve(path=args.socket, port=args.port))
+
+
+if __name__ == "__main__":
+    main()
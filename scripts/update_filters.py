@@ -0,0 +1,42 @@
+import pandas as pd
+from src.data_processor import get_dataset
+from src.models import list_fit_series, load_filter_state, save_filter_state
+from src.utils import save_output
+
+DATASET_ID = "Extended"
+
+
+def main():
+    series = get_dataset("Global", transform="log")
+    rows = {}
+
+    for model_name in list_fit_series(DATASET_ID):
+        state = load_filter_state(model_name, DATASET_ID)
+
+        # Only returns after the last absorbed date are filtered
+        new_returns = series.loc[series.index > pd.Timestamp(state.last_date)]
+        for date, r in new_returns.items():
+            state.update(r, date.strftime("%Y-%m-%d"))  # pyright: ignore
+
+        if state.needs_refit:
+            print(f"Re-estimating {model_name} after {state.n_updates} updates...")
+            state = state.refit(series.loc[state.first_date :])
+
+        save_filter_state(state, model_name, DATASET_ID)
+
+        forecast = state.forecast(horizon=1)
+        rows[model_name] = {
+            "As of": state.last_date,
+            "Mean": forecast["mean"].iloc[0],
+            "Volatility": forecast["residual_variance"].iloc[0] ** 0.5,
+            "VaR (1%)": state.value_at_risk(0.01)[0],
+            "VaR (5%)": state.value_at_risk(0.05)[0],
+        }
+
+    df_forecasts = pd.DataFrame(rows).T
+    print(df_forecasts)
+    save_output(df_forecasts, "filter_forecasts.csv", "tables", "models")
+
+
+if __name__ == "__main__":
+    main()
@@ -202,6 +202,7 @@ def format_coef_std(fit_result):
     """
     Extracts coefficients and robust standard errors,
     returning a series with standard errors in parentheses below coefficients.
+    Accepts arch results and src.models.GARCHResult alike.
     """
     params = fit_result.params
     std_errs = fit_result.std_err
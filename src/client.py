@@ -0,0 +1,29 @@
+import json
+import socket
+from pathlib import Path
+
+# Kept free of numpy/pandas/arch so the client starts in milliseconds
+DEFAULT_SOCKET = Path(__file__).resolve().parent.parent / ".estimation.sock"
+
+
+def send_request(
+    request: dict, path: Path | None = None, port: int | None = None
+) -> dict:
+    """
+    Blocking client: sends one request and returns its result, raising
+    RuntimeError if the server reports an error.
+    """
+    if port is not None:
+        sock = socket.create_connection(("127.0.0.1", port))
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(str(path or DEFAULT_SOCKET))
+
+    with sock, sock.makefile("rwb") as f:
+        f.write(json.dumps(request).encode() + b"\n")
+        f.flush()
+        reply = json.loads(f.readline())
+
+    if not reply["ok"]:
+        raise RuntimeError(reply["error"])
+    return reply["result"]
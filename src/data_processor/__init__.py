@@ -1,3 +1,19 @@
 from ._cleaning import get_dataset
+from ._registry import (
+    register_dataset,
+    register_regimes,
+    get_dataset_range,
+    list_datasets,
+)
+from ._panel import build_panel, load_panel, get_panel_series
 
-__all__ = ["get_dataset"]
+__all__ = [
+    "get_dataset",
+    "register_dataset",
+    "register_regimes",
+    "get_dataset_range",
+    "list_datasets",
+    "build_panel",
+    "load_panel",
+    "get_panel_series",
+]
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 from src.utils import get_path
+from ._registry import get_dataset_range
+from ._panel import get_panel_series
 
 
 def _load_raw(source="ExchangeRate.csv"):
@@ -18,20 +20,23 @@ def _load_raw(source="ExchangeRate.csv"):
     return df.iloc[:, 0]
 
 
-def get_dataset(id: str, transform="log", scale=100.0) -> pd.DataFrame | pd.Series:
-    s = _load_raw()
-
-    ranges = {
-        "Dataset I": ("1978-01-03", "1994-06-29"),
-        "Dataset II": ("1986-01-02", "2003-02-21"),
-        "Extended": ("2003-01-01", "2023-12-31"),
-    }
-
+def get_dataset(
+    id: str,
+    transform="log",
+    scale=100.0,
+    currency: str | list[str] | None = None,
+) -> pd.DataFrame | pd.Series:
     # Add a global option to get everything for the overview plot
-    if id == "Global":
-        subset = s
+    start, end = (None, None) if id == "Global" else get_dataset_range(id)
+
+    if currency is None:
+        s = _load_raw()
+        subset = s.loc[start:end]
     else:
-        subset = s.loc[ranges[id][0] : ranges[id][1]]
+        # Slice the panel store; keep only days on which every market traded
+        subset = get_panel_series(currency, start, end).dropna()
+        if isinstance(currency, str):
+            subset = subset.iloc[:, 0]
 
     if transform == "log":
         return (np.log(subset / subset.shift(1)).dropna()) * scale
@@ -0,0 +1,133 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from src.utils import get_path
+
+# Loaded stores are kept here so repeated get_dataset calls share one memmap
+_panel_cache: dict[Path, tuple[np.ndarray, np.ndarray, list[str]]] = {}
+
+
+def _read_fx_csv(path: Path) -> pd.Series:
+    """
+    Reads one per-currency CSV into a float series indexed by date.
+    Headers are stripped and lower-cased (e.g. "date, value"), the date is
+    taken from the "date" column or the first column, and the rate from the
+    first remaining column. Missing-value markers such as "." become NaN.
+    """
+    df = pd.read_csv(path, skipinitialspace=True)
+    df.columns = [str(c).strip().lower() for c in df.columns]
+    if df.shape[1] < 2:
+        raise ValueError(f"{path.name}: expected a date and a value column.")
+
+    date_col = "date" if "date" in df.columns else df.columns[0]
+    value_col = next(c for c in df.columns if c != date_col)
+
+    dates = pd.to_datetime(df[date_col], errors="coerce")
+    values = pd.to_numeric(df[value_col], errors="coerce")
+    s = pd.Series(values.to_numpy(dtype=float), index=dates, name=path.stem)
+    s = s[s.index.notna()].dropna().sort_index()
+
+    if s.empty:
+        raise ValueError(f"{path.name}: no valid observations.")
+    if s.index.has_duplicates:
+        raise ValueError(f"{path.name}: duplicate dates.")
+    if (s <= 0).any():
+        raise ValueError(f"{path.name}: non-positive exchange rates.")
+
+    return s
+
+
+def build_panel(
+    source_dir: Path | None = None,
+    store: Path | None = None,
+    pattern: str = "*.csv",
+    max_workers: int | None = None,
+) -> Path:
+    """
+    Reads every CSV in source_dir on a thread pool, aligns the series to a
+    common business-day calendar and writes them once to a panel store:
+    values.npy (dates x currencies, float64, NaN where a market is closed),
+    dates.npy (datetime64[D]) and currencies.json. Currencies are named
+    after the file stems; weekend quotes are dropped by the calendar.
+    """
+    source_dir = source_dir or get_path("")
+    store = store or get_path("panel")
+
+    files = sorted(Path(source_dir).glob(pattern))
+    if not files:
+        raise FileNotFoundError(f"No files matching '{pattern}' in {source_dir}.")
+
+    # pandas releases the GIL while parsing, so threads overlap the I/O
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        series = list(pool.map(_read_fx_csv, files))
+
+    start = min(s.index[0] for s in series)
+    end = max(s.index[-1] for s in series)
+    calendar = pd.bdate_range(start, end)
+
+    values = np.full((len(calendar), len(series)), np.nan)
+    for j, s in enumerate(series):
+        s = s[s.index.dayofweek < 5]
+        values[calendar.get_indexer(s.index), j] = s.to_numpy()
+
+    store = Path(store)
+    store.mkdir(parents=True, exist_ok=True)
+    np.save(store / "values.npy", values)
+    np.save(store / "dates.npy", calendar.to_numpy().astype("datetime64[D]"))
+    with open(store / "currencies.json", "w") as f:
+        json.dump([s.name for s in series], f)
+
+    _panel_cache.pop(store, None)
+    print(f"Panel of {len(series)} series x {len(calendar)} days saved to: {store}")
+    return store
+
+
+def load_panel(store: Path | None = None):
+    """
+    Returns (values, dates, currencies) with values memory-mapped read-only.
+    """
+    store = Path(store or get_path("panel"))
+    if store not in _panel_cache:
+        if not (store / "values.npy").exists():
+            raise FileNotFoundError(
+                f"No panel store at {store}. Run scripts/build_panel.py first."
+            )
+        values = np.load(store / "values.npy", mmap_mode="r")
+        dates = np.load(store / "dates.npy")
+        with open(store / "currencies.json", "r") as f:
+            currencies = json.load(f)
+        _panel_cache[store] = (values, dates, currencies)
+    return _panel_cache[store]
+
+
+def get_panel_series(
+    currencies: str | list[str],
+    start: str | None = None,
+    end: str | None = None,
+    store: Path | None = None,
+) -> pd.DataFrame:
+    """
+    Slices the panel by currency and date range. The date window is found by
+    binary search, so only the requested rows of the memmap are touched.
+    """
+    values, dates, names = load_panel(store)
+    if isinstance(currencies, str):
+        currencies = [currencies]
+
+    missing = [c for c in currencies if c not in names]
+    if missing:
+        raise KeyError(f"Currencies {missing} not in panel. Available: {names}")
+    cols = [names.index(c) for c in currencies]
+
+    lo = 0 if start is None else np.searchsorted(dates, np.datetime64(start, "D"))
+    hi = (
+        len(dates)
+        if end is None
+        else np.searchsorted(dates, np.datetime64(end, "D"), side="right")
+    )
+
+    return pd.DataFrame(
+        values[lo:hi, cols], index=pd.DatetimeIndex(dates[lo:hi]), columns=currencies
+    )
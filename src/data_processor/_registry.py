@@ -0,0 +1,78 @@
+import json
+from src.utils import get_path, load_config
+
+# Sample periods used in the paper; config.json may add to or override these
+_DEFAULT_DATASETS = {
+    "Dataset I": ("1978-01-03", "1994-06-29"),
+    "Dataset II": ("1986-01-02", "2003-02-21"),
+    "Extended": ("2003-01-01", "2023-12-31"),
+}
+
+_registry: dict[str, tuple[str, str]] = {}
+
+# Detected regimes live in an untracked file so config.json is never rewritten
+_REGIMES_FILE = "regimes.json"
+
+
+def _load_registry() -> dict[str, tuple[str, str]]:
+    if not _registry:
+        _registry.update(_DEFAULT_DATASETS)
+        try:
+            configured = load_config().get("datasets", {})
+        except FileNotFoundError:
+            configured = {}
+        for ds_id, (start, end) in configured.items():
+            _registry[ds_id] = (start, end)
+
+        regimes_path = get_path(_REGIMES_FILE)
+        if regimes_path.exists():
+            with open(regimes_path, "r") as f:
+                for ds_id, (start, end) in json.load(f).items():
+                    _registry[ds_id] = (start, end)
+    return _registry
+
+
+def register_dataset(id: str, start: str, end: str):
+    """
+    Registers a sample period under `id` for the current session so
+    get_dataset can slice it. Permanent entries belong in config.json.
+    """
+    _load_registry()[id] = (start, end)
+
+
+def register_regimes(regimes: list[tuple[str, str]], prefix: str = "Regime"):
+    """
+    Registers regimes as "<prefix> 1", "<prefix> 2", ... and saves them to
+    data/regimes.json. All earlier "<prefix> *" entries are replaced, so a
+    re-run that finds fewer regimes leaves no stale ones behind.
+    """
+    registry = _load_registry()
+    for ds_id in [k for k in registry if k.startswith(f"{prefix} ")]:
+        del registry[ds_id]
+
+    regimes_path = get_path(_REGIMES_FILE)
+    saved = {}
+    if regimes_path.exists():
+        with open(regimes_path, "r") as f:
+            saved = json.load(f)
+    saved = {k: v for k, v in saved.items() if not k.startswith(f"{prefix} ")}
+
+    for i, (start, end) in enumerate(regimes, 1):
+        ds_id = f"{prefix} {i}"
+        registry[ds_id] = (start, end)
+        saved[ds_id] = [start, end]
+
+    with open(regimes_path, "w") as f:
+        json.dump(saved, f, indent=2)
+    return [f"{prefix} {i}" for i in range(1, len(regimes) + 1)]
+
+
+def get_dataset_range(id: str) -> tuple[str, str]:
+    registry = _load_registry()
+    if id not in registry:
+        raise KeyError(f"Unknown dataset '{id}'. Registered datasets: {list(registry)}")
+    return registry[id]
+
+
+def list_datasets() -> list[str]:
+    return list(_load_registry())
@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+
+# 5% asymptotic critical values. Both statistics converge to the supremum
+# of a Brownian bridge (Inclan & Tiao, 1994; Sanso, Arago & Carrion, 2004)
+CRITICAL_VALUES = {"icss": 1.358, "kappa2": 1.358}
+
+
+def _bartlett_lrv(x: np.ndarray) -> float:
+    """
+    Bartlett-kernel long-run variance of x with Newey-West bandwidth.
+    """
+    n = len(x)
+    m = int(4 * (n / 100) ** (2 / 9))
+    u = x - x.mean()
+    lrv = u @ u / n
+    for lag in range(1, min(m, n - 1) + 1):
+        lrv += 2 * (1 - lag / (m + 1)) * (u[lag:] @ u[:-lag]) / n
+    return lrv
+
+
+def _cusum_of_squares(
+    psum: np.ndarray,
+    e2: np.ndarray,
+    start: int,
+    end: int,
+    method: str,
+    min_size: int = 1,
+):
+    """
+    Evaluates every candidate split in e2[start:end] at once from the global
+    prefix sums. Splits leave at least min_size observations on each side.
+    Returns the break position (index of the last observation of the first
+    regime) and the test statistic.
+    """
+    n = end - start
+    if n < 2 * max(min_size, 1):
+        return None, 0.0
+
+    # C_k for k = 1..n, taken as differences of the prefix sums
+    c = psum[start + 1 : end + 1] - psum[start]
+    c_total = c[-1]
+    k = np.arange(1, n + 1)
+
+    if method == "icss":
+        # D_k = C_k / C_T - k / T, scaled by sqrt(T / 2)
+        stat_k = np.sqrt(n / 2) * np.abs(c / c_total - k / n)
+    elif method == "kappa2":
+        # G_k = C_k - (k / T) C_T, scaled by a HAC estimate of Var(e_t^2)
+        omega = _bartlett_lrv(e2[start:end])
+        stat_k = np.abs(c - k / n * c_total) / np.sqrt(n * omega)
+    else:
+        raise ValueError(f"Unknown method '{method}'. Use 'icss' or 'kappa2'.")
+
+    # Only k in [min_size, n - min_size] are admissible split points
+    lo = max(min_size, 1)
+    stat_k = stat_k[lo - 1 : n - lo]
+    pos = int(np.argmax(stat_k))
+    return start + lo - 1 + pos, float(stat_k[pos])
+
+
+def _significant_break(psum, e2, start, end, method, crit, min_size):
+    pos, stat = _cusum_of_squares(psum, e2, start, end, method, min_size)
+    return pos if pos is not None and stat > crit else None
+
+
+def detect_variance_breaks(
+    series: pd.Series,
+    method: str = "kappa2",
+    min_size: int = 30,
+    max_iter: int = 20,
+) -> list[pd.Timestamp]:
+    """
+    Iterated cumulative sums of squares (ICSS) algorithm of Inclan & Tiao
+    (1994). Every regime keeps at least min_size observations. Returns the
+    dates of the last observation before each break.
+    """
+    e = series.to_numpy(dtype=float)
+    e = e - e.mean()
+    e2 = e**2
+    psum = np.concatenate(([0.0], np.cumsum(e2)))
+    crit = CRITICAL_VALUES[method]
+    T = len(e)
+
+    # Step 1-2: peel off the first and last break until none are left
+    candidates = []
+    start, end = 0, T
+    while True:
+        pos = _significant_break(psum, e2, start, end, method, crit, min_size)
+        if pos is None:
+            break
+
+        k_first = pos
+        while True:
+            inner = _significant_break(
+                psum, e2, start, k_first + 1, method, crit, min_size
+            )
+            if inner is None:
+                break
+            k_first = inner
+
+        k_last = pos
+        while True:
+            inner = _significant_break(
+                psum, e2, k_last + 1, end, method, crit, min_size
+            )
+            if inner is None:
+                break
+            k_last = inner
+
+        candidates.append(k_first)
+        if k_first == k_last:
+            break
+        candidates.append(k_last)
+        start, end = k_first + 1, k_last + 1
+
+    # Step 3: re-test each break between its neighbours until stable
+    breaks = sorted(set(candidates))
+    for _ in range(max_iter):
+        bounds = [-1] + breaks + [T - 1]
+        refined = []
+        for j in range(1, len(bounds) - 1):
+            pos = _significant_break(
+                psum,
+                e2,
+                bounds[j - 1] + 1,
+                bounds[j + 1] + 1,
+                method,
+                crit,
+                min_size,
+            )
+            if pos is not None:
+                refined.append(pos)
+        refined = sorted(set(refined))
+        converged = len(refined) == len(breaks) and all(
+            abs(a - b) <= 2 for a, b in zip(refined, breaks)
+        )
+        breaks = refined
+        if converged:
+            break
+
+    return [series.index[b] for b in breaks]
+
+
+def get_regimes(series: pd.Series, breaks: list[pd.Timestamp]) -> list[tuple[str, str]]:
+    """
+    Converts break dates into (start, end) date strings for each regime.
+    """
+    positions = [series.index.get_loc(b) for b in breaks]
+    bounds = [-1] + positions + [len(series) - 1]
+    return [
+        (
+            series.index[bounds[j] + 1].strftime("%Y-%m-%d"),  # pyright: ignore
+            series.index[bounds[j + 1]].strftime("%Y-%m-%d"),  # pyright: ignore
+        )
+        for j in range(len(bounds) - 1)
+    ]
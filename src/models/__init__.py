@@ -0,0 +1,25 @@
+from ._specs import MODEL_SPECS, EXTENDED_SPECS
+from ._garch import ARGARCH, GARCHResult, fit_ar_garch
+from ._export import save_fit_series, load_fit_series, list_fit_series
+from ._dcc import DCC, DCCResult, fit_dcc
+from ._two_stage import TwoStageResult, fit_two_stage
+from ._filter import FilterState, save_filter_state, load_filter_state
+
+__all__ = [
+    "MODEL_SPECS",
+    "EXTENDED_SPECS",
+    "ARGARCH",
+    "GARCHResult",
+    "fit_ar_garch",
+    "save_fit_series",
+    "load_fit_series",
+    "list_fit_series",
+    "DCC",
+    "DCCResult",
+    "fit_dcc",
+    "TwoStageResult",
+    "fit_two_stage",
+    "FilterState",
+    "save_filter_state",
+    "load_filter_state",
+]
@@ -0,0 +1,91 @@
+import json
+import re
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from src.utils import get_path
+
+# Row order of each per-fit array
+SERIES_FIELDS = ("conditional_volatility", "resid", "std_resid")
+
+
+def _slug(name: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", name.lower())
+    return slug.strip("-")
+
+
+def _align(values, nobs: int) -> np.ndarray:
+    # Fits drop the AR(1) start-up observation; pad it back as NaN
+    values = np.asarray(values, dtype=np.float32)
+    out = np.full(nobs, np.nan, dtype=np.float32)
+    out[nobs - len(values) :] = values
+    return out
+
+
+def save_fit_series(
+    fits: dict, dataset_id: str, index: pd.DatetimeIndex, store: Path | None = None
+) -> Path:
+    """
+    Writes conditional volatility, residuals and standardized residuals of
+    each fit as one float32 (3 x T) .npy file per model under
+    <store>/<dataset>/. Works with arch results and GARCHResult alike.
+    """
+    store = Path(store or get_path("fits"))
+    ds_dir = store / _slug(dataset_id)
+    ds_dir.mkdir(parents=True, exist_ok=True)
+
+    dates = index.to_numpy().astype("datetime64[D]")
+    dates_path = ds_dir / "dates.npy"
+    manifest_path = ds_dir / "manifest.json"
+    manifest = {"dataset": dataset_id, "models": {}}
+
+    # Keep earlier fits only if they were made on the same sample
+    if manifest_path.exists() and np.array_equal(np.load(dates_path), dates):
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+    np.save(dates_path, dates)
+
+    for model_name, fit in fits.items():
+        arr = np.vstack(
+            [_align(getattr(fit, field), len(index)) for field in SERIES_FIELDS]
+        )
+        filename = f"{_slug(model_name)}.npy"
+        np.save(ds_dir / filename, arr)
+        manifest["models"][model_name] = filename
+
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"Fit series saved to: {ds_dir}")
+    return ds_dir
+
+
+def _read_manifest(dataset_id: str, store: Path | None) -> tuple[Path, dict]:
+    ds_dir = Path(store or get_path("fits")) / _slug(dataset_id)
+    with open(ds_dir / "manifest.json", "r") as f:
+        return ds_dir, json.load(f)["models"]
+
+
+def list_fit_series(dataset_id: str, store: Path | None = None) -> list[str]:
+    return list(_read_manifest(dataset_id, store)[1])
+
+
+def load_fit_series(
+    model_name: str, dataset_id: str, store: Path | None = None
+) -> dict[str, np.ndarray]:
+    """
+    Memory-maps a saved fit. Returns the dates and one read-only view per
+    field in SERIES_FIELDS; no data is copied until it is used.
+    """
+    ds_dir, manifest = _read_manifest(dataset_id, store)
+    if model_name not in manifest:
+        raise KeyError(
+            f"No saved series for '{model_name}' on '{dataset_id}'. "
+            f"Available: {list(manifest)}"
+        )
+
+    arr = np.load(ds_dir / manifest[model_name], mmap_mode="r")
+    series = {"dates": np.load(ds_dir / "dates.npy", mmap_mode="r")}
+    for i, field in enumerate(SERIES_FIELDS):
+        series[field] = arr[i]
+    return series
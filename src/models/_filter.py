@@ -0,0 +1,290 @@
+import json
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from arch import arch_model
+from scipy.integrate import trapezoid
+from src.utils import get_path
+from ._export import _slug
+
+
+def _figarch_weights(phi: float, d: float, beta: float, truncation: int):
+    """
+    ARCH(inf) weights of FIGARCH(1,d,1), computed as in arch.
+    """
+    lam = np.empty(truncation)
+    delta = np.empty(truncation)
+    lam[0] = phi - beta + d
+    delta[0] = d
+    for i in range(1, truncation):
+        delta[i] = (i - d) / (i + 1) * delta[i - 1]
+        lam[i] = beta * lam[i - 1] + (delta[i] - phi * delta[i - 1])
+    return lam
+
+
+class FilterState:
+    """
+    Recursive state of a fitted AR(1) volatility model, so that each new
+    return updates the conditional variance without re-filtering the
+    sample.
+
+    GARCH/GJR and APARCH keep the next-period sigma^delta (delta = 2 for
+    GARCH) and update in O(1). FIGARCH keeps the last `truncation`
+    squared residuals in a ring buffer stored twice over, so the lag
+    window is always a contiguous slice; its update costs O(truncation),
+    independent of the sample length.
+    """
+
+    def __init__(
+        self,
+        spec: dict,
+        params: pd.Series,
+        y_last: float,
+        level: float,
+        resid_last: float,
+        first_date: str,
+        last_date: str,
+        buffer: np.ndarray | None = None,
+        pos: int = 0,
+        n_updates: int = 0,
+        refit_every: int = 20,
+    ):
+        self.spec = spec
+        self.params = params
+        self.kind = spec.get("vol", "GARCH").upper()
+        if self.kind not in ("GARCH", "APARCH", "FIGARCH"):
+            raise ValueError(f"Unsupported volatility process '{self.kind}'.")
+
+        self.y_last = y_last
+        self.level = level
+        self.resid_last = resid_last
+        self.first_date = first_date
+        self.last_date = last_date
+        self.buffer = buffer
+        self.pos = pos
+        self.n_updates = n_updates
+        self.refit_every = refit_every
+
+        # Distribution object for quantiles, rebuilt from the spec
+        self._dist = arch_model(None, **spec).distribution
+        n_dist = len(self._dist.parameter_names())
+        self._dist_params = params.to_numpy()[len(params) - n_dist :]
+
+        if self.kind == "FIGARCH":
+            assert buffer is not None
+            self._lam_rev = _figarch_weights(
+                params["phi"], params["d"], params["beta"], len(buffer) // 2
+            )[::-1].copy()
+
+    @property
+    def delta(self) -> float:
+        if self.kind == "APARCH":
+            return float(self.params["delta"])
+        return 2.0
+
+    @property
+    def needs_refit(self) -> bool:
+        return self.n_updates >= self.refit_every
+
+    def _window(self) -> np.ndarray:
+        # Oldest to newest squared residual, as a view into the buffer
+        k = len(self.buffer) // 2  # pyright: ignore
+        return self.buffer[self.pos + 1 : self.pos + 1 + k]  # pyright: ignore
+
+    def _push(self, value: float):
+        k = len(self.buffer) // 2  # pyright: ignore
+        self.pos = (self.pos + 1) % k
+        self.buffer[self.pos] = value  # pyright: ignore
+        self.buffer[self.pos + k] = value  # pyright: ignore
+
+    def _next_level(self, e: float, level: float) -> float:
+        p = self.params
+        if self.kind == "GARCH":
+            gamma = p.get("gamma[1]", 0.0) if e < 0 else 0.0
+            return p["omega"] + (p["alpha[1]"] + gamma) * e**2 + p["beta[1]"] * level
+        if self.kind == "APARCH":
+            shock = abs(e) - p.get("gamma[1]", 0.0) * e
+            return (
+                p["omega"] + p["alpha[1]"] * shock ** p["delta"] + p["beta[1]"] * level
+            )
+
+        omega_tilde = p["omega"] / (1 - p["beta"])
+        return omega_tilde + self._lam_rev @ self._window()
+
+    def update(self, r: float, date: str | None = None) -> float:
+        """
+        Absorbs one new return and returns the next-period variance.
+        """
+        e = r - self.params["Const"] - self.params["y[1]"] * self.y_last
+        if self.kind == "FIGARCH":
+            self._push(e**2)
+        self.level = self._next_level(e, self.level)
+
+        self.y_last = r
+        self.resid_last = e
+        self.n_updates += 1
+        if date is not None:
+            self.last_date = date
+        return self.level ** (2.0 / self.delta)
+
+    def _kappa(self) -> float:
+        # E[(|z| - gamma z)^delta] under the fitted standardized density
+        z = np.linspace(-50, 50, 200001)
+        pdf = np.exp(
+            self._dist.loglikelihood(
+                self._dist_params, z, np.ones_like(z), individual=True
+            )
+        )
+        shock = np.abs(z) - self.params.get("gamma[1]", 0.0) * z
+        return float(trapezoid(shock**self.delta * pdf, z))
+
+    def forecast(self, horizon: int = 1) -> pd.DataFrame:
+        """
+        Mean, conditional residual variance and forecast-error variance of
+        the return for 1..horizon steps ahead, named as in arch. APARCH
+        multi-step variances are (E sigma^delta)^(2/delta), an approximation
+        for delta != 2.
+        """
+        p = self.params
+        mean = np.empty(horizon)
+        variance = np.empty(horizon)
+        residual_variance = np.empty(horizon)
+
+        m = p["Const"] + p["y[1]"] * self.y_last
+        level = self.level
+        if self.kind == "FIGARCH":
+            window = list(self._window())
+            omega_tilde = p["omega"] / (1 - p["beta"])
+        elif self.kind == "APARCH":
+            persistence = p["alpha[1]"] * self._kappa() + p["beta[1]"]
+        else:
+            persistence = p["alpha[1]"] + 0.5 * p.get("gamma[1]", 0.0) + p["beta[1]"]
+
+        for h in range(horizon):
+            mean[h] = m
+            residual_variance[h] = level ** (2.0 / self.delta)
+            # The AR(1) term carries earlier shocks into the return forecast
+            variance[h] = residual_variance[h] + (
+                p["y[1]"] ** 2 * variance[h - 1] if h else 0.0
+            )
+            m = p["Const"] + p["y[1]"] * m
+            if self.kind == "FIGARCH":
+                # Future squared residuals are replaced by their forecasts
+                window = window[1:] + [residual_variance[h]]  # pyright: ignore
+                lags = np.asarray(window)
+                level = omega_tilde + self._lam_rev @ lags  # pyright: ignore
+            else:
+                level = p["omega"] + persistence * level  # pyright: ignore
+
+        return pd.DataFrame(
+            {
+                "mean": mean,
+                "residual_variance": residual_variance,
+                "variance": variance,
+            },
+            index=pd.RangeIndex(1, horizon + 1, name="h"),
+        )
+
+    def value_at_risk(self, level: float = 0.01, horizon: int = 1) -> np.ndarray:
+        """
+        VaR at `level` for each step ahead, reported as a positive loss.
+        Multi-step quantiles treat the return forecast error as scaled by
+        the fitted standardized distribution.
+        """
+        fc = self.forecast(horizon)
+        q = self._dist.ppf(level, self._dist_params)
+        return -(fc["mean"].to_numpy() + np.sqrt(fc["variance"].to_numpy()) * q)
+
+    def refit(self, data: pd.Series) -> "FilterState":
+        """
+        Full re-estimation on data; the schedule counter starts afresh.
+        """
+        fit = arch_model(data.to_numpy(), **self.spec).fit(disp="off")
+        return FilterState.from_fit(
+            fit, self.spec, data.index, refit_every=self.refit_every
+        )
+
+    @classmethod
+    def from_fit(
+        cls, fit, spec: dict, index: pd.DatetimeIndex, refit_every: int = 20
+    ) -> "FilterState":
+        """
+        Builds the state at the end of the estimation sample from an arch
+        result for an AR(1) mean model.
+        """
+        params = fit.params
+        resid = np.asarray(fit.resid, dtype=float)
+        resid = resid[~np.isnan(resid)]
+        sigma2_last = float(np.asarray(fit.conditional_volatility)[-1]) ** 2
+        e = float(resid[-1])
+
+        kind = spec.get("vol", "GARCH").upper()
+        buffer = None
+        if kind == "FIGARCH":
+            k = fit.model.volatility.truncation
+            padded = np.full(k, fit.model.volatility.backcast(resid))
+            tail = resid[-k:] ** 2
+            padded[k - len(tail) :] = tail
+            buffer = np.concatenate([padded, padded])
+            level = 0.0
+        elif kind == "APARCH":
+            level = sigma2_last ** (params["delta"] / 2.0)
+        else:
+            level = sigma2_last
+
+        state = cls(
+            spec=spec,
+            params=params,
+            y_last=float(np.asarray(fit.model.y)[-1]),
+            level=level,
+            resid_last=e,
+            first_date=str(index[0].date()),
+            last_date=str(index[-1].date()),
+            buffer=buffer,
+            # The newest squared residual sits at the end of the window
+            pos=len(buffer) // 2 - 1 if buffer is not None else 0,
+            refit_every=refit_every,
+        )
+        # Level refers to the last in-sample period; roll it one step forward
+        state.level = state._next_level(e, level)
+        return state
+
+
+def save_filter_state(
+    state: FilterState, model_name: str, dataset_id: str, store: Path | None = None
+) -> Path:
+    """
+    Writes the state next to the fit's series as <model>.state.npz.
+    """
+    ds_dir = Path(store or get_path("fits")) / _slug(dataset_id)
+    ds_dir.mkdir(parents=True, exist_ok=True)
+    path = ds_dir / f"{_slug(model_name)}.state.npz"
+
+    meta = {
+        "spec": state.spec,
+        "param_names": list(state.params.index),
+        "y_last": state.y_last,
+        "level": state.level,
+        "resid_last": state.resid_last,
+        "first_date": state.first_date,
+        "last_date": state.last_date,
+        "pos": state.pos,
+        "n_updates": state.n_updates,
+        "refit_every": state.refit_every,
+    }
+    arrays = {"params": state.params.to_numpy()}
+    if state.buffer is not None:
+        arrays["buffer"] = state.buffer
+    np.savez(path, meta=json.dumps(meta), **arrays)
+    return path
+
+
+def load_filter_state(
+    model_name: str, dataset_id: str, store: Path | None = None
+) -> FilterState:
+    ds_dir = Path(store or get_path("fits")) / _slug(dataset_id)
+    with np.load(ds_dir / f"{_slug(model_name)}.state.npz") as f:
+        meta = json.loads(str(f["meta"]))
+        params = pd.Series(f["params"], index=meta.pop("param_names"))
+        buffer = f["buffer"].copy() if "buffer" in f else None
+    return FilterState(params=params, buffer=buffer, **meta)
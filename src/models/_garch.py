@@ -0,0 +1,265 @@
+import warnings
+import numpy as np
+import pandas as pd
+from arch.utility.exceptions import ConvergenceWarning
+from scipy import stats
+from scipy.optimize import minimize
+from scipy.signal import lfilter
+
+# Parameter names follow the arch package so results slot into PARAM_MAP
+_MEAN_NAMES = ["Const", "y[1]"]
+
+
+def _backcast(resids: np.ndarray) -> float:
+    """
+    Exponentially weighted pre-sample variance, as in arch.
+    """
+    tau = min(75, resids.shape[0])
+    w = 0.94 ** np.arange(tau)
+    w = w / w.sum()
+    return float(np.sum(resids[:tau] ** 2 * w))
+
+
+def _ar1_design(data: np.ndarray):
+    y = data[1:]
+    x = np.column_stack([np.ones(len(y)), data[:-1]])
+    return y, x
+
+
+class GARCHResult:
+    """
+    Estimates of an AR(1)-GARCH(1,1) or AR(1)-GJR-GARCH(1,1,1) model.
+    Mirrors the attributes of arch's ARCHModelResult used in this project.
+    """
+
+    def __init__(
+        self, params, param_cov, loglikelihood, resid, conditional_volatility
+    ):
+        self.params = params
+        self.param_cov = param_cov
+        self.std_err = pd.Series(np.sqrt(np.diag(param_cov)), index=params.index)
+        self.tvalues = params / self.std_err
+        self.pvalues = pd.Series(
+            2 * stats.norm.sf(np.abs(self.tvalues)), index=params.index
+        )
+        self.loglikelihood = loglikelihood
+        self.resid = resid
+        self.conditional_volatility = conditional_volatility
+        self.std_resid = resid / conditional_volatility
+        self.nobs = len(resid)
+
+        k = len(params)
+        self.aic = -2 * loglikelihood + 2 * k
+        self.bic = -2 * loglikelihood + np.log(self.nobs) * k
+
+
+class ARGARCH:
+    """
+    AR(1) mean with a GARCH(1,1) (o=0) or GJR-GARCH(1,1,1) (o=1) variance,
+    estimated by Gaussian QMLE.
+
+    The conditional variance and its first and second derivatives all obey
+    linear recursions with coefficient beta, so each is produced by a single
+    IIR filter pass over the sample. This gives the exact score and Hessian
+    in O(T), replacing the finite differences arch uses for robust errors.
+    """
+
+    def __init__(self, data, o: int = 0):
+        if o not in (0, 1):
+            raise ValueError("Only o=0 (GARCH) and o=1 (GJR) are supported.")
+
+        self.data = np.asarray(data, dtype=float)
+        self.o = o
+        self.y, self.x = _ar1_design(self.data)
+        self.nobs = len(self.y)
+
+        vol_names = ["omega", "alpha[1]"] + (["gamma[1]"] if o else []) + ["beta[1]"]
+        self.param_names = _MEAN_NAMES + vol_names
+
+        # The backcast is fixed at the OLS residuals, not re-evaluated per trial
+        self._ols = np.linalg.lstsq(self.x, self.y, rcond=None)[0]
+        self._backcast = _backcast(self.y - self.x @ self._ols)
+
+    def _unpack(self, params):
+        mu_rho = params[:2]
+        omega, alpha = params[2], params[3]
+        gamma = params[4] if self.o else 0.0
+        beta = params[-1]
+        return mu_rho, omega, alpha, gamma, beta
+
+    def _variance(self, params):
+        """
+        Returns residuals, the conditional variance h_t and the lagged
+        ARCH loading a_{t-1} = alpha + gamma * 1[e_{t-1} < 0].
+        """
+        mu_rho, omega, alpha, gamma, beta = self._unpack(params)
+        b = self._backcast
+
+        e = self.y - self.x @ mu_rho
+        neg = (e < 0).astype(float)
+        a = alpha + gamma * neg
+
+        u = np.empty(self.nobs)
+        u[0] = omega + (alpha + 0.5 * gamma + beta) * b
+        u[1:] = omega + a[:-1] * e[:-1] ** 2
+        h = lfilter([1.0], [1.0, -beta], u)
+        return e, h, a, neg
+
+    def _variance_gradient(self, params, e, h, a, neg):
+        """
+        dh_t / dtheta for all t, shape (T, k).
+        """
+        beta = params[-1]
+        b = self._backcast
+        k = len(params)
+        de = -self.x
+
+        z = np.zeros((self.nobs, k))
+        z[1:, :2] = 2 * (a[:-1] * e[:-1])[:, None] * de[:-1]
+        z[:, 2] = 1.0
+        z[0, 3] = b
+        z[1:, 3] = e[:-1] ** 2
+        if self.o:
+            z[0, 4] = 0.5 * b
+            z[1:, 4] = neg[:-1] * e[:-1] ** 2
+        z[0, -1] = b
+        z[1:, -1] = h[:-1]
+        return lfilter([1.0], [1.0, -beta], z, axis=0)
+
+    def _variance_hessian(self, params, e, a, neg, dh):
+        """
+        d^2 h_t / dtheta dtheta' for all t, shape (T, k, k).
+        """
+        beta = params[-1]
+        k = len(params)
+        de = -self.x
+
+        w = np.zeros((self.nobs, k, k))
+        de_lag = de[:-1]
+        outer = de_lag[:, :, None] * de_lag[:, None, :]
+        w[1:, :2, :2] = 2 * a[:-1, None, None] * outer
+
+        cross = 2 * e[:-1, None] * de_lag
+        w[1:, :2, 3] = cross
+        w[1:, 3, :2] = cross
+        if self.o:
+            w[1:, :2, 4] += neg[:-1, None] * cross
+            w[1:, 4, :2] += neg[:-1, None] * cross
+
+        # beta multiplies h_{t-1}, so its row and column pick up dh_{t-1}
+        w[1:, -1, :] += dh[:-1]
+        w[1:, :, -1] += dh[:-1]
+        return lfilter([1.0], [1.0, -beta], w, axis=0)
+
+    def loglikelihood(self, params, individual: bool = False):
+        e, h, _, _ = self._variance(params)
+        llf = -0.5 * (np.log(2 * np.pi) + np.log(h) + e**2 / h)
+        return llf if individual else float(llf.sum())
+
+    def score(self, params, individual: bool = False):
+        e, h, a, neg = self._variance(params)
+        dh = self._variance_gradient(params, e, h, a, neg)
+        scores = -0.5 * (1 / h - e**2 / h**2)[:, None] * dh
+        scores[:, :2] += (e / h)[:, None] * self.x
+        return scores if individual else scores.sum(axis=0)
+
+    def hessian(self, params):
+        e, h, a, neg = self._variance(params)
+        dh = self._variance_gradient(params, e, h, a, neg)
+        d2h = self._variance_hessian(params, e, a, neg, dh)
+
+        k = len(params)
+        de = np.zeros((self.nobs, k))
+        de[:, :2] = -self.x
+
+        c_hh = -1 / h**2 + 2 * e**2 / h**3
+        c_h = 1 / h - e**2 / h**2
+        hess = (
+            np.einsum("t,ti,tj->ij", c_hh, dh, dh)
+            + np.einsum("t,tij->ij", c_h, d2h)
+            - np.einsum("t,ti,tj->ij", 2 * e / h**2, de, dh)
+            - np.einsum("t,ti,tj->ij", 2 * e / h**2, dh, de)
+            + np.einsum("t,ti,tj->ij", 2 / h, de, de)
+        )
+        return -0.5 * hess
+
+    def _starting_values(self):
+        resid_var = float(np.mean((self.y - self.x @ self._ols) ** 2))
+        vol = [0.05 * resid_var, 0.04] + ([0.02] if self.o else []) + [0.9]
+        return np.concatenate([self._ols, vol])
+
+    def _bounds_and_constraints(self):
+        v = float(np.mean((self.y - self.x @ self._ols) ** 2))
+        bounds = [(-np.inf, np.inf)] * 2 + [(1e-8 * v, 10.0 * v), (0.0, 1.0)]
+        if self.o:
+            bounds.append((-1.0, 2.0))
+        bounds.append((0.0, 1.0))
+
+        # Linear constraints A @ params >= b, as in arch:
+        # alpha + gamma / 2 + beta <= 1 and, for GJR, alpha + gamma >= 0
+        k = len(bounds)
+        a = np.zeros((1 + self.o, k))
+        a[0, 3] = a[0, -1] = -1.0
+        b = np.array([-1.0] + [0.0] * self.o)
+        if self.o:
+            a[0, 4] = -0.5
+            a[1, 3] = a[1, 4] = 1.0
+
+        constraints = {
+            "type": "ineq",
+            "fun": lambda p: a @ p - b,
+            "jac": lambda p: a,
+        }
+        return bounds, constraints
+
+    def fit(self, cov_type: str = "robust") -> GARCHResult:
+        """
+        Maximises the Gaussian likelihood with SLSQP and an analytic
+        gradient. cov_type="robust" gives Bollerslev-Wooldridge standard
+        errors, "classic" the inverse Hessian.
+        """
+        scale = self.nobs
+        bounds, constraints = self._bounds_and_constraints()
+        opt = minimize(
+            lambda p: -self.loglikelihood(p) / scale,
+            self._starting_values(),
+            jac=lambda p: -self.score(p) / scale,
+            method="SLSQP",
+            bounds=bounds,
+            constraints=constraints,
+            options={"ftol": 1e-10, "maxiter": 500},
+        )
+        if not opt.success:
+            # Same warning class as arch, so existing filters apply
+            warnings.warn(
+                f"The optimizer did not converge: {opt.message}",
+                ConvergenceWarning,
+                stacklevel=2,
+            )
+        params = opt.x
+
+        # Same sandwich as arch: H^-1 Cov(s_t) H^-1 / T with averaged H
+        hess = -self.hessian(params) / self.nobs
+        inv_hess = np.linalg.inv(hess)
+        if cov_type == "robust":
+            score_cov = np.cov(self.score(params, individual=True).T)
+            param_cov = inv_hess @ score_cov @ inv_hess / self.nobs
+        elif cov_type == "classic":
+            param_cov = inv_hess / self.nobs
+        else:
+            raise ValueError(f"Unknown cov_type '{cov_type}'.")
+
+        e, h, _, _ = self._variance(params)
+        return GARCHResult(
+            params=pd.Series(params, index=self.param_names),
+            param_cov=pd.DataFrame(
+                param_cov, index=self.param_names, columns=self.param_names
+            ),
+            loglikelihood=self.loglikelihood(params),
+            resid=e,
+            conditional_volatility=np.sqrt(h),
+        )
+
+
+def fit_ar_garch(data, o: int = 0, cov_type: str = "robust") -> GARCHResult:
+    return ARGARCH(data, o=o).fit(cov_type=cov_type)
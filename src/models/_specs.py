@@ -0,0 +1,16 @@
+# arch_model keywords for every named specification in the paper
+MODEL_SPECS = {
+    "GARCH": {"mean": "AR", "lags": 1, "vol": "GARCH", "p": 1, "o": 0, "q": 1},
+    "AGARCH": {"mean": "AR", "lags": 1, "vol": "GARCH", "p": 1, "o": 1, "q": 1},
+    "APARCH": {"mean": "AR", "lags": 1, "vol": "APARCH", "p": 1, "o": 1, "q": 1},
+    "FIGARCH": {"mean": "AR", "lags": 1, "vol": "FIGARCH", "p": 1, "q": 1},
+}
+
+# Extended sample battery: GARCH(1,1) and FIGARCH(1,d,1) under three
+# distributions, suffixed -N (Gaussian), -t (Student's t) and -G (GED)
+EXTENDED_SPECS = {
+    f"{vol}-{suffix}": {**MODEL_SPECS[vol], "dist": dist}
+    for vol in ("GARCH", "FIGARCH")
+    for suffix, dist in (("N", "normal"), ("t", "t"), ("G", "ged"))
+}
+MODEL_SPECS.update(EXTENDED_SPECS)
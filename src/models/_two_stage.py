@@ -0,0 +1,187 @@
+import numpy as np
+import pandas as pd
+from arch import arch_model
+from arch.univariate import FIGARCH
+from arch.univariate.recursions import figarch_weights
+from scipy.signal import fftconvolve
+from statsmodels.tools.numdiff import approx_hess
+
+# Mean keywords are replaced by the first-stage OLS in two-stage mode
+_MEAN_KEYS = ("mean", "lags", "x", "hold_back")
+_EPS = np.finfo(float).eps
+
+
+class TwoStageResult:
+    """
+    AR(1) mean by OLS followed by a zero-mean variance model on the
+    residuals. std_err is corrected for the first-stage estimation
+    uncertainty; params, fit statistics and series mirror arch results.
+    """
+
+    def __init__(self, params, param_cov, loglikelihood, nobs, variance_fit):
+        self.params = params
+        self.param_cov = param_cov
+        self.std_err = pd.Series(np.sqrt(np.diag(param_cov)), index=params.index)
+        self.loglikelihood = loglikelihood
+        self.nobs = nobs
+        self.variance_fit = variance_fit
+
+        self.resid = variance_fit.resid
+        self.conditional_volatility = variance_fit.conditional_volatility
+        self.std_resid = variance_fit.std_resid
+
+        k = len(params)
+        self.aic = -2 * loglikelihood + 2 * k
+        self.bic = -2 * loglikelihood + np.log(nobs) * k
+
+
+def _figarch_variance(volatility, params, resids, backcast, var_bounds):
+    """
+    FIGARCH conditional variance as a single FFT convolution. The ARCH(inf)
+    form has no feedback through sigma^2, so the truncated lag sum, the
+    backcast weight and the bounds check all vectorise; the result equals
+    arch's recursion, which costs O(T * truncation).
+    """
+    p, q, trunc = volatility.p, volatility.q, volatility.truncation
+    nobs = len(resids)
+    power = volatility.power
+    fresids = np.abs(resids) ** power
+
+    omega = params[0]
+    beta = params[1 + p + q] if q else 0.0
+    lam = figarch_weights(params[1:], p, q, trunc)
+
+    # Pre-sample lags are filled with the backcast: weight sum_{i >= t} lam_i
+    bc_weight = np.zeros(nobs)
+    tail = np.cumsum(lam[::-1])[::-1]
+    bc_weight[: min(nobs, trunc)] = tail[: min(nobs, trunc)]
+
+    sigma2 = omega / (1 - beta) + bc_weight * backcast
+    sigma2[1:] += fftconvolve(fresids, lam)[: nobs - 1]
+
+    lower, upper = var_bounds[:, 0], var_bounds[:, 1]
+    sigma2 = np.maximum(sigma2, lower)
+    over = sigma2 > upper
+    sigma2[over] = np.where(
+        np.isinf(sigma2[over]),
+        upper[over] + 1000,
+        upper[over] + np.log(sigma2[over] / upper[over]),
+    )
+    return sigma2 ** (2.0 / power)
+
+
+def _stage_two_loglikelihood(model, params, resids, backcast, var_bounds):
+    """
+    Per-observation log-likelihood of a zero-mean arch model, using the
+    public volatility and distribution interfaces (FIGARCH variances are
+    convolved directly).
+    """
+    n_vol = model.volatility.num_params
+    if isinstance(model.volatility, FIGARCH):
+        sigma2 = _figarch_variance(
+            model.volatility, params[:n_vol], resids, backcast, var_bounds
+        )
+    else:
+        sigma2 = np.zeros_like(resids)
+        model.volatility.compute_variance(
+            params[:n_vol], resids, sigma2, backcast, var_bounds
+        )
+    return model.distribution.loglikelihood(
+        params[n_vol:], resids, sigma2, individual=True
+    )
+
+
+def _two_step_cov(y, x, ols, model, params, backcast, var_bounds) -> np.ndarray:
+    """
+    Sandwich covariance of the stacked estimating equations
+    psi_t = (x_t e_t, s_t), which carries first-stage uncertainty into the
+    variance parameters (Newey & McFadden, 1994, Sec. 6).
+
+    The scores, the cross derivatives with respect to the mean parameters
+    and the variance-parameter Hessian are all differenced here, so arch's
+    own covariance is never computed.
+    """
+    k1 = len(ols)
+    k2 = len(params)
+    nobs = len(y)
+
+    def llf(mean_params, vol_params):
+        resids = y - x @ mean_params
+        return _stage_two_loglikelihood(model, vol_params, resids, backcast, var_bounds)
+
+    # Central differences in theta_2 give the per-observation scores; the
+    # same stencil, shifted forward in each theta_1, gives the cross terms
+    h2 = _EPS ** (1 / 3) * np.maximum(np.abs(params), 0.1)
+    h1 = _EPS ** (1 / 3) * np.maximum(np.abs(ols), 0.1)
+
+    def central(mean_params):
+        return np.column_stack(
+            [
+                (
+                    llf(mean_params, params + h2[i] * np.eye(k2)[i])
+                    - llf(mean_params, params - h2[i] * np.eye(k2)[i])
+                )
+                / (2 * h2[i])
+                for i in range(k2)
+            ]
+        )
+
+    scores = central(ols)
+    score_sum = scores.sum(axis=0)
+    cross = np.column_stack(
+        [
+            (central(ols + h1[j] * np.eye(k1)[j]).sum(axis=0) - score_sum) / h1[j]
+            for j in range(k1)
+        ]
+    )
+    # Same Hessian approximation as arch's classic covariance
+    hess = approx_hess(params, lambda p: llf(ols, p).sum())
+
+    resids = y - x @ ols
+    psi = np.column_stack([x * resids[:, None], scores])
+
+    a = np.zeros((k1 + k2, k1 + k2))
+    a[:k1, :k1] = -x.T @ x
+    a[k1:, :k1] = cross
+    a[k1:, k1:] = hess
+    a /= nobs
+
+    inv_a = np.linalg.inv(a)
+    return inv_a @ np.cov(psi.T) @ inv_a.T / nobs
+
+
+def fit_two_stage(data, specs: dict[str, dict]) -> dict[str, TwoStageResult]:
+    """
+    Estimates the AR(1) mean once by OLS, then fits every variance and
+    distribution specification in specs (arch_model keywords) to the
+    residuals with a zero mean. Intended for screening large batteries
+    before the final joint QMLE fits.
+    """
+    data = np.asarray(data, dtype=float)
+    y = data[1:]
+    x = np.column_stack([np.ones(len(y)), data[:-1]])
+    ols = np.linalg.lstsq(x, y, rcond=None)[0]
+    resids = y - x @ ols
+
+    results = {}
+    for name, spec in specs.items():
+        spec = {k: v for k, v in spec.items() if k not in _MEAN_KEYS}
+        model = arch_model(resids, mean="Zero", **spec)
+        fit = model.fit(disp="off")
+
+        backcast = model.volatility.backcast(resids)
+        var_bounds = model.volatility.variance_bounds(resids)
+        param_cov = _two_step_cov(
+            y, x, ols, model, fit.params.to_numpy(), backcast, var_bounds
+        )
+
+        names = ["Const", "y[1]"] + list(fit.params.index)
+        results[name] = TwoStageResult(
+            params=pd.Series(np.concatenate([ols, fit.params]), index=names),
+            param_cov=pd.DataFrame(param_cov, index=names, columns=names),
+            loglikelihood=fit.loglikelihood,
+            nobs=len(y),
+            variance_fit=fit,
+        )
+
+    return results
@@ -0,0 +1,195 @@
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from arch import arch_model
+from src._latex_tables import DESIRED_ORDER, PARAM_MAP, format_coef_std
+from src.data_processor import get_dataset
+from src.models import MODEL_SPECS
+from src.client import DEFAULT_SOCKET
+from src.utils import save_output
+
+
+def _fit_worker(spec: str, data: np.ndarray, cov_type: str):
+    # Runs in a pool process; the result is pickled back to the server
+    return arch_model(data, **MODEL_SPECS[spec]).fit(disp="off", cov_type=cov_type)
+
+
+def _descriptives_worker(data: np.ndarray):
+    from src.descriptives.diagnostics import (
+        get_descriptive_stats,
+        get_mean_model_diagnostics,
+    )
+
+    return {**get_descriptive_stats(data), **get_mean_model_diagnostics(data)}
+
+
+def _summarize_fit(fit) -> dict:
+    return {
+        "params": fit.params.to_dict(),
+        "std_err": fit.std_err.to_dict(),
+        "loglikelihood": float(fit.loglikelihood),
+        "aic": float(fit.aic),
+        "bic": float(fit.bic),
+    }
+
+
+class EstimationServer:
+    """
+    Long-running server that keeps parsed series, descriptive statistics
+    and fitted models in memory between requests. Requests and replies are
+    single-line JSON objects with a "cmd" field:
+
+        {"cmd": "fit", "spec": "GARCH-t", "dataset": "Extended"}
+        {"cmd": "descriptives", "datasets": [...], "refresh": false}
+        {"cmd": "table", "dataset": "Extended", "specs": [...], "filename": ...}
+        {"cmd": "status"} / {"cmd": "shutdown"}
+
+    CPU-bound estimation runs on a process pool so the event loop stays
+    responsive while several fits are in flight.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self._pool = ProcessPoolExecutor(max_workers=max_workers)
+        self._series: dict[str, pd.Series] = {}
+        self._fits: dict[tuple[str, str, str], object] = {}
+        self._pending: dict[tuple[str, str, str], asyncio.Future] = {}
+        self._descriptives: dict[str, dict] = {}
+        self._server: asyncio.AbstractServer | None = None
+
+    def _get_series(self, dataset: str) -> pd.Series:
+        if dataset not in self._series:
+            self._series[dataset] = get_dataset(dataset, transform="log")
+        return self._series[dataset]
+
+    async def _fit(self, spec: str, dataset: str, cov_type: str = "robust"):
+        if spec not in MODEL_SPECS:
+            raise KeyError(f"Unknown spec '{spec}'. Available: {list(MODEL_SPECS)}")
+
+        key = (spec, dataset, cov_type)
+        if key in self._fits:
+            return self._fits[key]
+
+        # Concurrent requests for the same fit share one pool job
+        if key not in self._pending:
+            loop = asyncio.get_running_loop()
+            data = self._get_series(dataset).to_numpy()
+            self._pending[key] = loop.run_in_executor(
+                self._pool, _fit_worker, spec, data, cov_type
+            )
+        try:
+            fit = await self._pending[key]
+        finally:
+            self._pending.pop(key, None)
+        self._fits[key] = fit
+        return fit
+
+    async def _handle_fit(self, request: dict) -> dict:
+        fit = await self._fit(
+            request["spec"], request["dataset"], request.get("cov_type", "robust")
+        )
+        return _summarize_fit(fit)
+
+    async def _handle_descriptives(self, request: dict) -> dict:
+        # An empty or missing list means every paper sample
+        datasets = request.get("datasets") or ["Dataset I", "Dataset II", "Extended"]
+        if request.get("refresh"):
+            for ds in datasets:
+                self._series.pop(ds, None)
+                self._descriptives.pop(ds, None)
+
+        loop = asyncio.get_running_loop()
+        todo = [ds for ds in datasets if ds not in self._descriptives]
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._pool, _descriptives_worker, self._get_series(ds).to_numpy()
+                )
+                for ds in todo
+            )
+        )
+        self._descriptives.update(zip(todo, results))
+        return {ds: self._descriptives[ds] for ds in datasets}
+
+    async def _handle_table(self, request: dict) -> dict:
+        dataset = request["dataset"]
+        specs = request["specs"]
+        fits = await asyncio.gather(*(self._fit(spec, dataset) for spec in specs))
+
+        df_results = pd.DataFrame(
+            {spec: format_coef_std(fit) for spec, fit in zip(specs, fits)}
+        )
+        existing_order = [k for k in DESIRED_ORDER if k in df_results.index]
+        df_results = df_results.loc[existing_order]
+        df_results.index = [PARAM_MAP.get(idx, idx) for idx in df_results.index]
+
+        filename = request.get("filename", f"results_{dataset}.tex")
+        save_output(
+            df_results,
+            filename,
+            "tables",
+            "models",
+            caption=request.get("caption"),
+            note=request.get("note"),
+        )
+        return {"filename": filename}
+
+    async def _dispatch(self, request: dict) -> dict:
+        cmd = request.get("cmd")
+        if cmd == "fit":
+            return await self._handle_fit(request)
+        if cmd == "descriptives":
+            return await self._handle_descriptives(request)
+        if cmd == "table":
+            return await self._handle_table(request)
+        if cmd == "status":
+            return {
+                "series": list(self._series),
+                "fits": [list(k) for k in self._fits],
+                "descriptives": list(self._descriptives),
+            }
+        if cmd == "shutdown":
+            assert self._server is not None
+            self._server.close()
+            return {}
+        raise ValueError(f"Unknown cmd '{cmd}'.")
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    result = await self._dispatch(json.loads(line))
+                    reply = {"ok": True, "result": result}
+                except Exception as exc:
+                    reply = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+                writer.write(json.dumps(reply, default=str).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, path: Path | None = None, port: int | None = None):
+        """
+        Listens on a Unix socket (default) or on localhost:port.
+        """
+        if port is not None:
+            self._server = await asyncio.start_server(
+                self._handle_client, "127.0.0.1", port
+            )
+            print(f"Estimation server listening on 127.0.0.1:{port}")
+        else:
+            path = Path(path or DEFAULT_SOCKET)
+            path.unlink(missing_ok=True)
+            self._server = await asyncio.start_unix_server(
+                self._handle_client, str(path)
+            )
+            print(f"Estimation server listening on {path}")
+
+        try:
+            async with self._server:
+                await self._server.wait_closed()
+        finally:
+            self._pool.shutdown()
+            if port is None:
+                Path(path).unlink(missing_ok=True)  # pyright: ignore